@@ -1,6 +1,6 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Depends, Request, Response, status, File, UploadFile, Form
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import StreamingResponse
+from fastapi.responses import StreamingResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
@@ -13,6 +13,7 @@ from typing import List, Optional, Dict
 import uuid
 from datetime import datetime, timezone, timedelta
 from enum import Enum
+from collections import defaultdict
 import hashlib
 import requests
 import pandas as pd
@@ -24,6 +25,7 @@ from reportlab.lib import colors
 from reportlab.lib.units import inch
 import aiofiles
 import mimetypes
+import time
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -34,7 +36,7 @@ UPLOADS_DIR.mkdir(exist_ok=True)
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(mongo_url, tz_aware=True)
 db = client[os.environ['DB_NAME']]
 
 # Create the main app without a prefix
@@ -90,6 +92,7 @@ class AdminAnalytics(BaseModel):
     average_project_value: float = 0.0
     project_completion_rate: float = 0.0
     revenue_by_client: Dict[str, float] = Field(default_factory=dict)  # client_id: revenue
+    completed_at: Optional[datetime] = None  # Set once the month has closed and figures are final
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
@@ -222,12 +225,22 @@ class SessionResponse(BaseModel):
     user: User
     session_token: str
 
+# Task fields stored as BSON dates rather than ISO strings
+TASK_NATIVE_DATE_FIELDS = ("created_at",)
+
+# Sort sentinel for records without a timestamp (oldest possible aware datetime)
+_EPOCH_MIN = datetime.min.replace(tzinfo=timezone.utc)
+
 # Helper functions
-def prepare_for_mongo(data):
-    """Convert datetime objects to ISO strings for MongoDB storage"""
+def prepare_for_mongo(data, native_fields=()):
+    """Convert datetime objects to ISO strings for MongoDB storage.
+
+    Keys listed in native_fields keep their datetime value so they are stored
+    as BSON dates and can be range-filtered on the server.
+    """
     if isinstance(data, dict):
         for key, value in data.items():
-            if isinstance(value, datetime):
+            if isinstance(value, datetime) and key not in native_fields:
                 data[key] = value.isoformat()
     return data
 
@@ -352,6 +365,30 @@ async def init_database():
         
         print("✅ Default admin account created: rusithink")
 
+async def migrate_task_dates():
+    """Convert legacy ISO-string task created_at values to BSON dates.
+
+    Runs on startup, so it must never stop the API from coming up: a string
+    that doesn't parse is left as it is, and any other failure (e.g. a Mongo
+    server before 4.2 without pipeline updates) is logged and skipped.
+    """
+    try:
+        result = await db.tasks.update_many(
+            {"created_at": {"$type": "string"}},
+            [{"$set": {"created_at": {"$dateFromString": {
+                "dateString": "$created_at",
+                "onError": "$created_at"
+            }}}}]
+        )
+        if result.modified_count:
+            print(f"✅ Migrated created_at to BSON dates for {result.modified_count} task(s)")
+        
+        unconverted = await db.tasks.count_documents({"created_at": {"$type": "string"}})
+        if unconverted:
+            logger.warning(f"{unconverted} task(s) kept an unparseable string created_at and are left out of analytics")
+    except Exception:
+        logger.exception("Task created_at migration failed; continuing startup")
+
 # Authentication Routes
 @api_router.get("/")
 async def api_root():
@@ -408,6 +445,7 @@ async def register_user(user_data: UserRegistration, response: Response):
         # Save user to database
         user_dict = prepare_for_mongo(user.dict())
         await db.users.insert_one(user_dict)
+        invalidate_admin_analytics_cache()
         
         logger.info(f"User created successfully: {user_data.email}")
         
@@ -561,6 +599,7 @@ async def process_oauth_session(request: Request, response: Response):
             }
             
             await db.users.insert_one(user_dict)
+            invalidate_admin_analytics_cache()
         
         user = User(**user_dict)
         
@@ -625,15 +664,49 @@ async def create_task(task_data: TaskCreate, request: Request):
         client_name=user.name
     )
     
-    # Prepare for MongoDB storage
-    task_mongo = prepare_for_mongo(task_obj.dict())
+    # Prepare for MongoDB storage (created_at stays a BSON date for analytics)
+    task_mongo = prepare_for_mongo(task_obj.dict(), native_fields=TASK_NATIVE_DATE_FIELDS)
     
     try:
         await db.tasks.insert_one(task_mongo)
+        invalidate_admin_analytics_cache()
         return task_obj
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create task: {str(e)}")
 
+# Upper bound on one bulk create, which is a single insert_many echoed back in full
+MAX_BULK_TASKS = 100
+
+@api_router.post("/tasks/bulk", response_model=List[Task])
+async def create_tasks_bulk(tasks_data: List[TaskCreate], request: Request):
+    """Create several tasks for the current user in one request"""
+    user = await require_auth(request)
+    
+    if not tasks_data:
+        return []
+    if len(tasks_data) > MAX_BULK_TASKS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_TASKS} tasks can be created at once")
+    
+    task_objs = [
+        Task(
+            **task_data.dict(),
+            created_by=user.id,
+            client_email=user.email,
+            client_name=user.name
+        )
+        for task_data in tasks_data
+    ]
+    
+    try:
+        await db.tasks.insert_many([
+            prepare_for_mongo(task_obj.dict(), native_fields=TASK_NATIVE_DATE_FIELDS)
+            for task_obj in task_objs
+        ])
+        invalidate_admin_analytics_cache()
+        return task_objs
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to create tasks: {str(e)}")
+
 @api_router.get("/tasks", response_model=List[Task])
 async def get_tasks(request: Request):
     """Get tasks (clients see only their own, admins see all)"""
@@ -710,6 +783,8 @@ async def update_task(task_id: str, task_update: TaskUpdate, request: Request):
         update_data = prepare_for_mongo(update_data)
         
         await db.tasks.update_one({"id": task_id}, {"$set": update_data})
+        await reopen_admin_analytics_months([existing_task.get("created_at")])
+        invalidate_admin_analytics_cache()
         
         # Return updated task
         updated_task = await db.tasks.find_one({"id": task_id})
@@ -726,10 +801,12 @@ async def delete_task(task_id: str, request: Request):
     await require_admin(request)  # Only admins can delete
     
     try:
-        result = await db.tasks.delete_one({"id": task_id})
-        if result.deleted_count == 0:
+        deleted_task = await db.tasks.find_one_and_delete({"id": task_id}, {"created_at": 1})
+        if deleted_task is None:
             raise HTTPException(status_code=404, detail="Task not found")
         
+        await reopen_admin_analytics_months([deleted_task.get("created_at")])
+        invalidate_admin_analytics_cache()
         return {"message": "Task deleted successfully"}
     except HTTPException:
         raise
@@ -758,6 +835,8 @@ async def update_task_status(task_id: str, status: TaskStatus, request: Request)
         }
         
         await db.tasks.update_one({"id": task_id}, {"$set": update_data})
+        await reopen_admin_analytics_months([existing_task.get("created_at")])
+        invalidate_admin_analytics_cache()
         
         # Return updated task
         updated_task = await db.tasks.find_one({"id": task_id})
@@ -931,35 +1010,29 @@ async def send_message(message_data: ChatMessageCreate, request: Request):
     """Send a chat message"""
     user = await require_auth(request)
     
-    try:
-        # Get recipient user info
-        recipient = await db.users.find_one({"id": message_data.recipient_id})
-        if not recipient:
-            raise HTTPException(status_code=404, detail="Recipient not found")
-        
-        recipient = parse_from_mongo(recipient)
-        
-        # Create message
-        message = ChatMessage(
-            task_id=message_data.task_id,
-            sender_id=user.id,
-            sender_name=user.name,
-            sender_role=user.role.value,
-            recipient_id=message_data.recipient_id,
-            content=message_data.content,
-            message_type="text"
-        )
-        
-        # Save to database
-        message_data_mongo = prepare_for_mongo(message.dict())
-        await db.chat_messages.insert_one(message_data_mongo)
-        
-        return message
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to send message: {str(e)}")
+    # Get recipient user info
+    recipient = await db.users.find_one({"id": message_data.recipient_id})
+    if not recipient:
+        raise HTTPException(status_code=404, detail="Recipient not found")
+    
+    recipient = parse_from_mongo(recipient)
+    
+    # Create message
+    message = ChatMessage(
+        task_id=message_data.task_id,
+        sender_id=user.id,
+        sender_name=user.name,
+        sender_role=user.role.value,
+        recipient_id=message_data.recipient_id,
+        content=message_data.content,
+        message_type="text"
+    )
+    
+    # Save to database
+    message_data_mongo = prepare_for_mongo(message.dict())
+    await db.chat_messages.insert_one(message_data_mongo)
+    
+    return message
 
 @api_router.post("/chat/upload")
 async def upload_chat_file(
@@ -972,58 +1045,52 @@ async def upload_chat_file(
     """Upload file/image for chat"""
     user = await require_auth(request)
     
-    try:
-        # Validate file type and size
-        if file.size > 16 * 1024 * 1024:  # 16MB limit
-            raise HTTPException(status_code=400, detail="File too large (max 16MB)")
-        
-        # Validate file format
-        allowed_extensions = {'.pdf', '.png', '.jpg', '.jpeg', '.heic', '.csv'}
-        file_ext = Path(file.filename).suffix.lower()
-        if file_ext not in allowed_extensions:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"File type not allowed. Supported formats: {', '.join(allowed_extensions)}"
-            )
-        
-        # Generate unique filename
-        file_ext = Path(file.filename).suffix
-        unique_filename = f"{uuid.uuid4()}{file_ext}"
-        file_path = UPLOADS_DIR / unique_filename
-        
-        # Save file
-        async with aiofiles.open(file_path, 'wb') as f:
-            content_data = await file.read()
-            await f.write(content_data)
-        
-        # Determine message type
-        mime_type, _ = mimetypes.guess_type(file.filename)
-        message_type = "image" if mime_type and mime_type.startswith("image/") else "file"
-        
-        # Create chat message with file
-        message = ChatMessage(
-            task_id=task_id,
-            sender_id=user.id,
-            sender_name=user.name,
-            sender_role=user.role.value,
-            recipient_id=recipient_id,
-            content=content or f"Shared {message_type}: {file.filename}",
-            message_type=message_type,
-            file_url=f"/uploads/{unique_filename}",
-            file_name=file.filename,
-            file_size=file.size
+    # Validate file type and size
+    if file.size > 16 * 1024 * 1024:  # 16MB limit
+        raise HTTPException(status_code=400, detail="File too large (max 16MB)")
+    
+    # Validate file format
+    allowed_extensions = {'.pdf', '.png', '.jpg', '.jpeg', '.heic', '.csv'}
+    file_ext = Path(file.filename).suffix.lower()
+    if file_ext not in allowed_extensions:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"File type not allowed. Supported formats: {', '.join(allowed_extensions)}"
         )
-        
-        # Save to database
-        message_data_mongo = prepare_for_mongo(message.dict())
-        await db.chat_messages.insert_one(message_data_mongo)
-        
-        return message
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to upload file: {str(e)}")
+    
+    # Generate unique filename
+    file_ext = Path(file.filename).suffix
+    unique_filename = f"{uuid.uuid4()}{file_ext}"
+    file_path = UPLOADS_DIR / unique_filename
+    
+    # Save file
+    async with aiofiles.open(file_path, 'wb') as f:
+        content_data = await file.read()
+        await f.write(content_data)
+    
+    # Determine message type
+    mime_type, _ = mimetypes.guess_type(file.filename)
+    message_type = "image" if mime_type and mime_type.startswith("image/") else "file"
+    
+    # Create chat message with file
+    message = ChatMessage(
+        task_id=task_id,
+        sender_id=user.id,
+        sender_name=user.name,
+        sender_role=user.role.value,
+        recipient_id=recipient_id,
+        content=content or f"Shared {message_type}: {file.filename}",
+        message_type=message_type,
+        file_url=f"/uploads/{unique_filename}",
+        file_name=file.filename,
+        file_size=file.size
+    )
+    
+    # Save to database
+    message_data_mongo = prepare_for_mongo(message.dict())
+    await db.chat_messages.insert_one(message_data_mongo)
+    
+    return message
 
 @api_router.get("/chat/messages", response_model=List[ChatMessage])
 async def get_chat_messages(
@@ -1035,130 +1102,122 @@ async def get_chat_messages(
     """Get chat messages for current user"""
     user = await require_auth(request)
     
-    try:
-        # Build query filter based on user role and parameters
-        if user.role == UserRole.ADMIN:
-            if client_id:
-                # Admin viewing conversation with specific client
-                message_filter = {
-                    "$or": [
-                        {"sender_id": user.id, "recipient_id": client_id},
-                        {"sender_id": client_id, "recipient_id": user.id}
-                    ]
-                }
-            else:
-                # Admin viewing all their messages
-                message_filter = {
-                    "$or": [
-                        {"sender_id": user.id},
-                        {"recipient_id": user.id}
-                    ]
-                }
+    # Build query filter based on user role and parameters
+    if user.role == UserRole.ADMIN:
+        if client_id:
+            # Admin viewing conversation with specific client
+            message_filter = {
+                "$or": [
+                    {"sender_id": user.id, "recipient_id": client_id},
+                    {"sender_id": client_id, "recipient_id": user.id}
+                ]
+            }
         else:
-            # CLIENT: Get all messages between client and admin
-            # Find admin user
-            admin_user = await db.users.find_one({"role": "admin"})
-            if not admin_user:
-                raise HTTPException(status_code=404, detail="Admin user not found")
-            
-            admin_user = parse_from_mongo(admin_user)
-            admin_id = admin_user["id"]
-            
-            # Get conversation between client and admin
+            # Admin viewing all their messages
             message_filter = {
                 "$or": [
-                    {"sender_id": user.id, "recipient_id": admin_id},
-                    {"sender_id": admin_id, "recipient_id": user.id}
+                    {"sender_id": user.id},
+                    {"recipient_id": user.id}
                 ]
             }
+    else:
+        # CLIENT: Get all messages between client and admin
+        # Find admin user
+        admin_user = await db.users.find_one({"role": "admin"})
+        if not admin_user:
+            raise HTTPException(status_code=404, detail="Admin user not found")
         
-        # Add task filter if specified
-        if task_id:
-            message_filter["task_id"] = task_id
-        
-        # Get messages
-        messages = await db.chat_messages.find(message_filter).sort("created_at", -1).limit(limit).to_list(limit)
-        parsed_messages = [parse_from_mongo(msg) for msg in messages]
-        
-        # Mark messages as read if user is recipient
-        await db.chat_messages.update_many(
-            {"recipient_id": user.id, "is_read": False},
-            {"$set": {"is_read": True}}
-        )
-        
-        # Return in chronological order (oldest first)
-        parsed_messages.reverse()
-        return [ChatMessage(**msg) for msg in parsed_messages]
+        admin_user = parse_from_mongo(admin_user)
+        admin_id = admin_user["id"]
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch messages: {str(e)}")
+        # Get conversation between client and admin
+        message_filter = {
+            "$or": [
+                {"sender_id": user.id, "recipient_id": admin_id},
+                {"sender_id": admin_id, "recipient_id": user.id}
+            ]
+        }
+    
+    # Add task filter if specified
+    if task_id:
+        message_filter["task_id"] = task_id
+    
+    # Get messages
+    messages = await db.chat_messages.find(message_filter).sort("created_at", -1).limit(limit).to_list(limit)
+    parsed_messages = [parse_from_mongo(msg) for msg in messages]
+    
+    # Mark messages as read if user is recipient
+    await db.chat_messages.update_many(
+        {"recipient_id": user.id, "is_read": False},
+        {"$set": {"is_read": True}}
+    )
+    
+    # Return in chronological order (oldest first)
+    parsed_messages.reverse()
+    return [ChatMessage(**msg) for msg in parsed_messages]
 
 @api_router.get("/chat/conversations")
 async def get_conversations(request: Request):
     """Get list of conversations for current user"""
     user = await require_auth(request)
     
-    try:
-        # Get unique conversation partners
-        pipeline = [
-            {
-                "$match": {
-                    "$or": [
-                        {"sender_id": user.id},
-                        {"recipient_id": user.id}
+    # Get unique conversation partners
+    pipeline = [
+        {
+            "$match": {
+                "$or": [
+                    {"sender_id": user.id},
+                    {"recipient_id": user.id}
+                ]
+            }
+        },
+        {
+            "$group": {
+                "_id": {
+                    "$cond": [
+                        {"$eq": ["$sender_id", user.id]},
+                        "$recipient_id",
+                        "$sender_id"
                     ]
-                }
-            },
-            {
-                "$group": {
-                    "_id": {
+                },
+                "last_message": {"$last": "$$ROOT"},
+                "unread_count": {
+                    "$sum": {
                         "$cond": [
-                            {"$eq": ["$sender_id", user.id]},
-                            "$recipient_id",
-                            "$sender_id"
+                            {
+                                "$and": [
+                                    {"$eq": ["$recipient_id", user.id]},
+                                    {"$eq": ["$is_read", False]}
+                                ]
+                            },
+                            1,
+                            0
                         ]
-                    },
-                    "last_message": {"$last": "$$ROOT"},
-                    "unread_count": {
-                        "$sum": {
-                            "$cond": [
-                                {
-                                    "$and": [
-                                        {"$eq": ["$recipient_id", user.id]},
-                                        {"$eq": ["$is_read", False]}
-                                    ]
-                                },
-                                1,
-                                0
-                            ]
-                        }
                     }
                 }
-            },
-            {"$sort": {"last_message.created_at": -1}}
-        ]
-        
-        conversations = await db.chat_messages.aggregate(pipeline).to_list(100)
-        
-        # Get user details for each conversation
-        result = []
-        for conv in conversations:
-            other_user_id = conv["_id"]
-            other_user_data = await db.users.find_one({"id": other_user_id})
-            if other_user_data:
-                other_user_data = parse_from_mongo(other_user_data)
-                result.append({
-                    "user_id": other_user_id,
-                    "user_name": other_user_data.get("name", "Unknown"),
-                    "user_role": other_user_data.get("role", "client"),
-                    "last_message": parse_from_mongo(conv["last_message"]),
-                    "unread_count": conv["unread_count"]
-                })
-        
-        return result
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch conversations: {str(e)}")
+            }
+        },
+        {"$sort": {"last_message.created_at": -1}}
+    ]
+    
+    conversations = await db.chat_messages.aggregate(pipeline).to_list(100)
+    
+    # Get user details for each conversation
+    result = []
+    for conv in conversations:
+        other_user_id = conv["_id"]
+        other_user_data = await db.users.find_one({"id": other_user_id})
+        if other_user_data:
+            other_user_data = parse_from_mongo(other_user_data)
+            result.append({
+                "user_id": other_user_id,
+                "user_name": other_user_data.get("name", "Unknown"),
+                "user_role": other_user_data.get("role", "client"),
+                "last_message": parse_from_mongo(conv["last_message"]),
+                "unread_count": conv["unread_count"]
+            })
+    
+    return result
 
 # Project Timeline Routes
 @api_router.post("/tasks/{task_id}/milestones", response_model=ProjectMilestone)
@@ -1299,6 +1358,7 @@ async def delete_multiple_users(user_ids: List[str], request: Request):
                     continue
                 
                 # Delete user's tasks
+                task_dates = await db.tasks.distinct("created_at", {"created_by": user_id})
                 await db.tasks.delete_many({"created_by": user_id})
                 
                 # Delete user's chat messages
@@ -1311,6 +1371,9 @@ async def delete_multiple_users(user_ids: List[str], request: Request):
                 
                 # Delete the user
                 result = await db.users.delete_one({"id": user_id})
+                # Their tasks' months and their signup month (new_clients) change
+                await reopen_admin_analytics_months([*task_dates, user.get("created_at")])
+                invalidate_admin_analytics_cache()
                 if result.deleted_count > 0:
                     deleted_count += 1
                 
@@ -1349,6 +1412,7 @@ async def delete_user(user_id: str, request: Request):
             raise HTTPException(status_code=400, detail="Cannot delete admin accounts")
         
         # Delete user's tasks
+        task_dates = await db.tasks.distinct("created_at", {"created_by": user_id})
         await db.tasks.delete_many({"created_by": user_id})
         
         # Delete user's chat messages
@@ -1361,6 +1425,9 @@ async def delete_user(user_id: str, request: Request):
         
         # Delete the user
         result = await db.users.delete_one({"id": user_id})
+        # Their tasks' months and their signup month (new_clients) change
+        await reopen_admin_analytics_months([*task_dates, user.get("created_at")])
+        invalidate_admin_analytics_cache()
         
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="User not found")
@@ -1571,11 +1638,12 @@ async def admin_create_task_for_client(task_data: TaskCreate, client_email: str,
         client_name=client_user.name
     )
     
-    # Prepare for MongoDB storage
-    task_mongo = prepare_for_mongo(task_obj.dict())
+    # Prepare for MongoDB storage (created_at stays a BSON date for analytics)
+    task_mongo = prepare_for_mongo(task_obj.dict(), native_fields=TASK_NATIVE_DATE_FIELDS)
     
     try:
         await db.tasks.insert_one(task_mongo)
+        invalidate_admin_analytics_cache()
         return task_obj
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create task: {str(e)}")
@@ -1585,282 +1653,281 @@ async def get_admin_info_for_chat(request: Request):
     """Get admin user info for chat (accessible by clients)"""
     user = await require_auth(request)
     
-    try:
-        # Get admin user (assuming there's only one admin)
-        admin_user = await db.users.find_one({"role": "admin"})
-        if not admin_user:
-            raise HTTPException(status_code=404, detail="Admin user not found")
-        
-        admin_user = parse_from_mongo(admin_user)
-        
-        # Return only necessary info for chat
-        return {
-            "id": admin_user["id"],
-            "name": admin_user.get("name", "Admin"),
-            "role": admin_user["role"]
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get admin info: {str(e)}")
+    # Get admin user (assuming there's only one admin)
+    admin_user = await db.users.find_one({"role": "admin"})
+    if not admin_user:
+        raise HTTPException(status_code=404, detail="Admin user not found")
+    
+    admin_user = parse_from_mongo(admin_user)
+    
+    # Return only necessary info for chat
+    return {
+        "id": admin_user["id"],
+        "name": admin_user.get("name", "Admin"),
+        "role": admin_user["role"]
+    }
 
 @api_router.delete("/admin/chat/message/{message_id}")
 async def delete_chat_message(message_id: str, request: Request):
     """Delete a specific chat message (admin only)"""
     await require_admin(request)
     
-    try:
-        # Check if message exists
-        message = await db.chat_messages.find_one({"id": message_id})
-        if not message:
-            raise HTTPException(status_code=404, detail="Message not found")
-        
-        # Delete the message
-        result = await db.chat_messages.delete_one({"id": message_id})
-        
-        if result.deleted_count == 0:
-            raise HTTPException(status_code=404, detail="Message not found")
-        
-        return {"message": "Chat message deleted successfully"}
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to delete message: {str(e)}")
+    # Check if message exists
+    message = await db.chat_messages.find_one({"id": message_id})
+    if not message:
+        raise HTTPException(status_code=404, detail="Message not found")
+    
+    # Delete the message
+    result = await db.chat_messages.delete_one({"id": message_id})
+    
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Message not found")
+    
+    return {"message": "Chat message deleted successfully"}
 
 @api_router.delete("/admin/chat/conversation/{client_id}")
 async def delete_chat_conversation(client_id: str, request: Request):
     """Delete entire conversation with a client (admin only)"""
     await require_admin(request)
     
-    try:
-        current_user = await require_auth(request)
-        
-        # Check if client exists
-        client = await db.users.find_one({"id": client_id})
-        if not client:
-            raise HTTPException(status_code=404, detail="Client not found")
-        
-        client = parse_from_mongo(client)
-        
-        # Prevent deleting conversation with another admin
-        if client.get("role") == "admin":
-            raise HTTPException(status_code=400, detail="Cannot delete admin conversations")
-        
-        # Delete all messages between admin and this client
-        result = await db.chat_messages.delete_many({
-            "$or": [
-                {"sender_id": current_user.id, "recipient_id": client_id},
-                {"sender_id": client_id, "recipient_id": current_user.id}
-            ]
-        })
-        
-        deleted_count = result.deleted_count
-        
-        return {
-            "message": f"Conversation with {client.get('name', 'client')} deleted successfully",
-            "deleted_messages": deleted_count
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to delete conversation: {str(e)}")
+    current_user = await require_auth(request)
+    
+    # Check if client exists
+    client = await db.users.find_one({"id": client_id})
+    if not client:
+        raise HTTPException(status_code=404, detail="Client not found")
+    
+    client = parse_from_mongo(client)
+    
+    # Prevent deleting conversation with another admin
+    if client.get("role") == "admin":
+        raise HTTPException(status_code=400, detail="Cannot delete admin conversations")
+    
+    # Delete all messages between admin and this client
+    result = await db.chat_messages.delete_many({
+        "$or": [
+            {"sender_id": current_user.id, "recipient_id": client_id},
+            {"sender_id": client_id, "recipient_id": current_user.id}
+        ]
+    })
+    
+    deleted_count = result.deleted_count
+    
+    return {
+        "message": f"Conversation with {client.get('name', 'client')} deleted successfully",
+        "deleted_messages": deleted_count
+    }
 
 @api_router.delete("/admin/chat/bulk-delete")
 async def bulk_delete_chat_messages(message_ids: List[str], request: Request):
     """Delete multiple chat messages (admin only)"""
     await require_admin(request)
     
-    try:
-        deleted_count = 0
-        errors = []
-        
-        for message_id in message_ids:
-            try:
-                result = await db.chat_messages.delete_one({"id": message_id})
-                if result.deleted_count > 0:
-                    deleted_count += 1
-                else:
-                    errors.append(f"Message {message_id} not found")
-            except Exception as e:
-                errors.append(f"Error deleting message {message_id}: {str(e)}")
-        
-        return {
-            "message": f"Deleted {deleted_count} message(s)",
-            "deleted_count": deleted_count,
-            "errors": errors
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to bulk delete messages: {str(e)}")
+    deleted_count = 0
+    errors = []
+    
+    for message_id in message_ids:
+        try:
+            result = await db.chat_messages.delete_one({"id": message_id})
+            if result.deleted_count > 0:
+                deleted_count += 1
+            else:
+                errors.append(f"Message {message_id} not found")
+        except Exception as e:
+            errors.append(f"Error deleting message {message_id}: {str(e)}")
+    
+    return {
+        "message": f"Deleted {deleted_count} message(s)",
+        "deleted_count": deleted_count,
+        "errors": errors
+    }
 
 @api_router.get("/admin/chat/export/{client_id}")
 async def export_client_chat(client_id: str, request: Request):
     """Export chat messages for a specific client as PDF (admin only)"""
     await require_admin(request)
     
-    try:
-        # Get client user info
-        client_user = await db.users.find_one({"id": client_id})
-        if not client_user:
-            raise HTTPException(status_code=404, detail="Client not found")
-        
-        client_user = parse_from_mongo(client_user)
-        
-        # Get admin user (assuming there's only one admin)
-        admin_user = await db.users.find_one({"role": "admin"})
-        if not admin_user:
-            raise HTTPException(status_code=404, detail="Admin user not found")
-        
-        admin_user = parse_from_mongo(admin_user)
-        
-        # Fetch all messages between admin and this client
-        messages = await db.chat_messages.find({
-            "$or": [
-                {"sender_id": client_id, "recipient_id": admin_user["id"]},
-                {"sender_id": admin_user["id"], "recipient_id": client_id}
-            ]
-        }).sort("created_at", 1).to_list(1000)
-        
-        # Create PDF buffer
-        pdf_buffer = io.BytesIO()
-        doc = SimpleDocTemplate(pdf_buffer, pagesize=A4)
-        
-        # Get styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=16,
-            spaceAfter=30,
-            alignment=1  # Center alignment
-        )
-        
-        # Build PDF content
-        story = []
-        
-        # Add title
-        client_name = client_user.get('name', client_user.get('email', 'Unknown'))
-        title = Paragraph(f"Chat History with {client_name}", title_style)
-        story.append(title)
-        story.append(Spacer(1, 20))
-        
-        # Add export info
-        export_info = Paragraph(
-            f"<b>Client:</b> {client_name}<br/>"
-            f"<b>Email:</b> {client_user.get('email', 'N/A')}<br/>"
-            f"<b>Company:</b> {client_user.get('company_name', 'N/A')}<br/>"
-            f"<b>Export Date:</b> {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} UTC<br/>"
-            f"<b>Total Messages:</b> {len(messages)}",
-            styles['Normal']
-        )
-        story.append(export_info)
-        story.append(Spacer(1, 30))
-        
-        # Process messages
-        for i, msg in enumerate(messages):
-            msg = parse_from_mongo(msg)
-            
-            # Format datetime
-            created_at = msg.get('created_at', '')
-            if isinstance(created_at, datetime):
-                formatted_date = created_at.strftime('%Y-%m-%d %H:%M:%S')
-            else:
-                formatted_date = str(created_at)[:19]
-            
-            # Create message content
-            sender_name = msg.get('sender_name', 'Unknown')
-            sender_role = msg.get('sender_role', '').upper()
-            content = msg.get('content', '')
-            message_type = msg.get('message_type', 'text')
-            
-            # Message header
-            msg_header = f"<b>{sender_name} ({sender_role})</b> - {formatted_date}"
-            story.append(Paragraph(msg_header, styles['Heading3']))
-            
-            # Message content
-            if message_type == 'file':
-                file_name = msg.get('file_name', 'Unknown file')
-                file_size = msg.get('file_size', 0)
-                size_mb = round(file_size / (1024 * 1024), 2) if file_size else 0
-                content += f" [File: {file_name}, Size: {size_mb} MB]"
-            
-            msg_content = Paragraph(content, styles['Normal'])
-            story.append(msg_content)
-            story.append(Spacer(1, 15))
-            
-            # Add page break every 20 messages to avoid overcrowding
-            if (i + 1) % 20 == 0 and i < len(messages) - 1:
-                story.append(Spacer(1, 50))
-        
-        # Build PDF
-        doc.build(story)
-        pdf_buffer.seek(0)
-        
-        # Prepare response
-        client_name_clean = client_name.replace(' ', '_').replace('@', '_at_')
-        filename = f"chat_history_{client_name_clean}_{datetime.now().strftime('%Y%m%d')}.pdf"
-        
-        return StreamingResponse(
-            io.BytesIO(pdf_buffer.getvalue()),
-            media_type="application/pdf",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
+    # Get client user info
+    client_user = await db.users.find_one({"id": client_id})
+    if not client_user:
+        raise HTTPException(status_code=404, detail="Client not found")
+    
+    client_user = parse_from_mongo(client_user)
+    
+    # Get admin user (assuming there's only one admin)
+    admin_user = await db.users.find_one({"role": "admin"})
+    if not admin_user:
+        raise HTTPException(status_code=404, detail="Admin user not found")
+    
+    admin_user = parse_from_mongo(admin_user)
+    
+    # Fetch all messages between admin and this client
+    messages = await db.chat_messages.find({
+        "$or": [
+            {"sender_id": client_id, "recipient_id": admin_user["id"]},
+            {"sender_id": admin_user["id"], "recipient_id": client_id}
+        ]
+    }).sort("created_at", 1).to_list(1000)
+    
+    # Create PDF buffer
+    pdf_buffer = io.BytesIO()
+    doc = SimpleDocTemplate(pdf_buffer, pagesize=A4)
+    
+    # Get styles
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=16,
+        spaceAfter=30,
+        alignment=1  # Center alignment
+    )
+    
+    # Build PDF content
+    story = []
+    
+    # Add title
+    client_name = client_user.get('name', client_user.get('email', 'Unknown'))
+    title = Paragraph(f"Chat History with {client_name}", title_style)
+    story.append(title)
+    story.append(Spacer(1, 20))
+    
+    # Add export info
+    export_info = Paragraph(
+        f"<b>Client:</b> {client_name}<br/>"
+        f"<b>Email:</b> {client_user.get('email', 'N/A')}<br/>"
+        f"<b>Company:</b> {client_user.get('company_name', 'N/A')}<br/>"
+        f"<b>Export Date:</b> {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} UTC<br/>"
+        f"<b>Total Messages:</b> {len(messages)}",
+        styles['Normal']
+    )
+    story.append(export_info)
+    story.append(Spacer(1, 30))
+    
+    # Process messages
+    for i, msg in enumerate(messages):
+        msg = parse_from_mongo(msg)
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to export chat: {str(e)}")
+        # Format datetime
+        created_at = msg.get('created_at', '')
+        if isinstance(created_at, datetime):
+            formatted_date = created_at.strftime('%Y-%m-%d %H:%M:%S')
+        else:
+            formatted_date = str(created_at)[:19]
+        
+        # Create message content
+        sender_name = msg.get('sender_name', 'Unknown')
+        sender_role = msg.get('sender_role', '').upper()
+        content = msg.get('content', '')
+        message_type = msg.get('message_type', 'text')
+        
+        # Message header
+        msg_header = f"<b>{sender_name} ({sender_role})</b> - {formatted_date}"
+        story.append(Paragraph(msg_header, styles['Heading3']))
+        
+        # Message content
+        if message_type == 'file':
+            file_name = msg.get('file_name', 'Unknown file')
+            file_size = msg.get('file_size', 0)
+            size_mb = round(file_size / (1024 * 1024), 2) if file_size else 0
+            content += f" [File: {file_name}, Size: {size_mb} MB]"
+        
+        msg_content = Paragraph(content, styles['Normal'])
+        story.append(msg_content)
+        story.append(Spacer(1, 15))
+        
+        # Add page break every 20 messages to avoid overcrowding
+        if (i + 1) % 20 == 0 and i < len(messages) - 1:
+            story.append(Spacer(1, 50))
+    
+    # Build PDF
+    doc.build(story)
+    pdf_buffer.seek(0)
+    
+    # Prepare response
+    client_name_clean = client_name.replace(' ', '_').replace('@', '_at_')
+    filename = f"chat_history_{client_name_clean}_{datetime.now().strftime('%Y%m%d')}.pdf"
+    
+    return StreamingResponse(
+        io.BytesIO(pdf_buffer.getvalue()),
+        media_type="application/pdf",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
 
 @api_router.get("/admin/chat/conversations")
 async def get_admin_chat_conversations(request: Request):
     """Get list of all client conversations for admin"""
     await require_admin(request)
     
-    try:
-        # Get all clients
-        clients = await db.users.find({"role": "client"}).to_list(100)
+    # Get all clients
+    clients = await db.users.find({"role": "client"}).to_list(100)
+    
+    conversations = []
+    for client in clients:
+        client = parse_from_mongo(client)
         
-        conversations = []
-        for client in clients:
-            client = parse_from_mongo(client)
-            
-            # Get latest message with this client
-            latest_msg = await db.chat_messages.find({
-                "$or": [
-                    {"sender_id": client["id"]},
-                    {"recipient_id": client["id"]}
-                ]
-            }).sort("created_at", -1).limit(1).to_list(1)
-            
-            # Count unread messages from this client
-            unread_count = await db.chat_messages.count_documents({
-                "sender_id": client["id"],
-                "is_read": False
-            })
-            
-            conversation_info = {
-                "client_id": client["id"],
-                "client_name": client.get("name", "Unknown"),
-                "client_email": client.get("email", ""),
-                "client_company": client.get("company_name", ""),
-                "unread_count": unread_count,
-                "last_message": None,
-                "last_message_time": None
-            }
-            
-            if latest_msg:
-                msg = parse_from_mongo(latest_msg[0])
-                conversation_info["last_message"] = msg.get("content", "")[:50]
-                conversation_info["last_message_time"] = msg.get("created_at")
-            
-            conversations.append(conversation_info)
+        # Get latest message with this client
+        latest_msg = await db.chat_messages.find({
+            "$or": [
+                {"sender_id": client["id"]},
+                {"recipient_id": client["id"]}
+            ]
+        }).sort("created_at", -1).limit(1).to_list(1)
         
-        # Sort by last message time (most recent first)
-        conversations.sort(key=lambda x: x["last_message_time"] or datetime.min.replace(tzinfo=timezone.utc), reverse=True)
+        # Count unread messages from this client
+        unread_count = await db.chat_messages.count_documents({
+            "sender_id": client["id"],
+            "is_read": False
+        })
         
-        return conversations
+        conversation_info = {
+            "client_id": client["id"],
+            "client_name": client.get("name", "Unknown"),
+            "client_email": client.get("email", ""),
+            "client_company": client.get("company_name", ""),
+            "unread_count": unread_count,
+            "last_message": None,
+            "last_message_time": None
+        }
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch conversations: {str(e)}")
+        if latest_msg:
+            msg = parse_from_mongo(latest_msg[0])
+            conversation_info["last_message"] = msg.get("content", "")[:50]
+            conversation_info["last_message_time"] = msg.get("created_at")
+        
+        conversations.append(conversation_info)
+    
+    # Sort by last message time (most recent first)
+    conversations.sort(key=lambda x: x["last_message_time"] or _EPOCH_MIN, reverse=True)
+    
+    return conversations
+
+# In-process cache of admin analytics responses: (months, month_year) -> (stored_at, analytics).
+# Writes only clear the cache of the worker that handled them, so with several
+# workers another worker can serve figures up to ADMIN_ANALYTICS_CACHE_TTL old
+ADMIN_ANALYTICS_CACHE_TTL = 60  # seconds
+_admin_analytics_cache: Dict[tuple, tuple] = {}
+
+def invalidate_admin_analytics_cache():
+    """Drop cached admin analytics after a task or client write"""
+    _admin_analytics_cache.clear()
+
+async def reopen_admin_analytics_months(created_ats):
+    """Clear completed_at on the stored admin analytics of the months these
+    task or client created_at values fall in, so the next read recalculates them.
+
+    Closed months are served from storage, so any write to an older task
+    (status, price or deletion) or a client deletion has to reopen its month.
+    Bumping the revision also stops a calculation that started before this
+    write from closing the month again with the old figures.
+    """
+    months = {value.strftime("%Y-%m") for value in created_ats if isinstance(value, datetime)}
+    for month_year in months:
+        await db.admin_analytics.update_one(
+            {"month_year": month_year},
+            {"$unset": {"completed_at": ""}, "$inc": {"revision": 1}},
+            upsert=True
+        )
 
 # Analytics calculation functions
 async def calculate_client_analytics(client_id: str):
@@ -1869,30 +1936,26 @@ async def calculate_client_analytics(client_id: str):
         # Get all tasks for this client
         client_tasks = await db.tasks.find({"created_by": client_id}).to_list(1000)
         
+        # Count, total and bucket spending by month in a single pass
         total_projects = len(client_tasks)
-        completed_projects = len([task for task in client_tasks if task.get("status") == "completed"])
-        pending_projects = total_projects - completed_projects
+        completed_projects = 0
+        total_spent = 0.0
+        monthly_spending = defaultdict(float)
+        for task in client_tasks:
+            project_price = task.get("project_price") or 0
+            total_spent += project_price
+            if task.get("status") == "completed":
+                completed_projects += 1
+            
+            # Unparseable legacy strings are left unmigrated; skip those
+            task_date = task.get("created_at")
+            if isinstance(task_date, datetime):
+                monthly_spending[task_date.strftime("%Y-%m")] += project_price
         
-        # Calculate financial metrics
-        total_spent = sum(task.get("project_price") or 0 for task in client_tasks)
+        pending_projects = total_projects - completed_projects
         average_project_value = total_spent / total_projects if total_projects > 0 else 0
         project_completion_rate = (completed_projects / total_projects * 100) if total_projects > 0 else 0
         
-        # Calculate monthly spending
-        monthly_spending = {}
-        for task in client_tasks:
-            task_date = task.get("created_at")
-            if isinstance(task_date, str):
-                task_date = datetime.fromisoformat(task_date.replace('Z', '+00:00'))
-            elif isinstance(task_date, datetime):
-                pass
-            else:
-                continue
-                
-            month_key = task_date.strftime("%Y-%m")
-            project_price = task.get("project_price") or 0
-            monthly_spending[month_key] = monthly_spending.get(month_key, 0) + project_price
-        
         # Update or create client analytics
         analytics_data = {
             "client_id": client_id,
@@ -1901,7 +1964,7 @@ async def calculate_client_analytics(client_id: str):
             "pending_projects": pending_projects,
             "total_spent": total_spent,
             "average_project_value": average_project_value,
-            "monthly_spending": monthly_spending,
+            "monthly_spending": dict(monthly_spending),
             "project_completion_rate": project_completion_rate,
             "updated_at": datetime.now(timezone.utc)
         }
@@ -1932,21 +1995,14 @@ async def calculate_admin_analytics(month_year: str = None):
         else:
             end_date = datetime(year, month + 1, 1, tzinfo=timezone.utc)
         
-        # Get all tasks for this month
-        all_tasks = await db.tasks.find({}).to_list(10000)
-        month_tasks = []
+        # Noted before reading, so a reopen during this calculation is detected
+        stored = await db.admin_analytics.find_one({"month_year": month_year}, {"revision": 1})
+        revision = stored.get("revision") if stored else None
         
-        for task in all_tasks:
-            task_date = task.get("created_at")
-            if isinstance(task_date, str):
-                task_date = datetime.fromisoformat(task_date.replace('Z', '+00:00'))
-            elif isinstance(task_date, datetime):
-                pass
-            else:
-                continue
-                
-            if start_date <= task_date < end_date:
-                month_tasks.append(task)
+        # Get all tasks for this month
+        month_tasks = await db.tasks.find({
+            "created_at": {"$gte": start_date, "$lt": end_date}
+        }).to_list(10000)
         
         # Calculate metrics
         total_projects = len(month_tasks)
@@ -1965,13 +2021,11 @@ async def calculate_admin_analytics(month_year: str = None):
         all_users = await db.users.find({"role": "client"}).to_list(1000)
         for user in all_users:
             user_date = user.get("created_at")
+            if not user_date:
+                continue
             if isinstance(user_date, str):
                 user_date = datetime.fromisoformat(user_date.replace('Z', '+00:00'))
-            elif isinstance(user_date, datetime):
-                pass
-            else:
-                continue
-                
+            
             if start_date <= user_date < end_date:
                 new_clients_count += 1
         
@@ -2005,6 +2059,17 @@ async def calculate_admin_analytics(month_year: str = None):
             upsert=True
         )
         
+        # Months before the current one can no longer change, unless a task or
+        # client write reopened this one while it was being calculated
+        if month_year < datetime.now(timezone.utc).strftime("%Y-%m"):
+            completed_at = datetime.now(timezone.utc)
+            result = await db.admin_analytics.update_one(
+                {"month_year": month_year, "revision": revision},
+                {"$set": {"completed_at": completed_at}}
+            )
+            if result.modified_count:
+                analytics_data["completed_at"] = completed_at
+        
         return analytics_data
         
     except Exception as e:
@@ -2040,10 +2105,17 @@ async def get_admin_analytics(request: Request, months: int = 12):
     await require_admin(request)
     
     try:
-        analytics_data = []
+        month_keys = []
         current_date = datetime.now(timezone.utc)
+        current_month = current_date.strftime("%Y-%m")
+        
+        # Serve repeated dashboard polls from the cache
+        cache_key = (months, current_month)
+        cached = _admin_analytics_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < ADMIN_ANALYTICS_CACHE_TTL:
+            return cached[1]
         
-        # Get analytics for the last N months
+        # Build the keys for the last N months
         for i in range(months):
             # Calculate date for each month going backwards
             target_date = current_date.replace(day=1)  # First day of current month
@@ -2057,31 +2129,30 @@ async def get_admin_analytics(request: Request, months: int = 12):
                 month += 12
                 year -= 1
             
-            month_year = f"{year}-{month:02d}"
-            
-            # Calculate analytics for this month
-            month_analytics = await calculate_admin_analytics(month_year)
-            analytics_data.append(month_analytics)
+            month_keys.append(f"{year}-{month:02d}")
         
-        # Also get stored historical data
-        historical_records = await db.admin_analytics.find({}).sort("month_year", -1).limit(months).to_list(months)
+        # Fetch stored analytics for all requested months in one query
+        historical_records = await db.admin_analytics.find({"month_year": {"$in": month_keys}}).to_list(months)
         
-        # Merge calculated and historical data
         stored_data = {}
         for record in historical_records:
             record = parse_from_mongo(record)
             stored_data[record["month_year"]] = record
         
-        # Use stored data if available, otherwise use calculated data
+        # Closed months come straight from storage; only the current month
+        # (and any month never calculated) is recomputed
         final_analytics = []
-        for calc_data in analytics_data:
-            month_year = calc_data["month_year"]
-            if month_year in stored_data:
-                final_analytics.append(AdminAnalytics(**stored_data[month_year]))
+        for month_year in month_keys:
+            stored = stored_data.get(month_year)
+            if month_year < current_month and stored and stored.get("completed_at"):
+                final_analytics.append(AdminAnalytics(**stored))
             else:
+                calc_data = await calculate_admin_analytics(month_year)
                 final_analytics.append(AdminAnalytics(**calc_data))
         
-        return final_analytics[::-1]  # Return chronological order
+        final_analytics.reverse()  # Return chronological order
+        _admin_analytics_cache[cache_key] = (time.monotonic(), final_analytics)
+        return final_analytics
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get admin analytics: {str(e)}")
@@ -2122,6 +2193,8 @@ async def recalculate_analytics(request: Request):
             await calculate_admin_analytics(month_year)
             admin_months += 1
         
+        invalidate_admin_analytics_cache()
+        
         return {
             "message": "Analytics recalculated successfully",
             "clients_processed": client_count,
@@ -2131,6 +2204,23 @@ async def recalculate_analytics(request: Request):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to recalculate analytics: {str(e)}")
 
+# Unexpected errors are logged once here with a reference id instead of
+# being wrapped into 500s by each endpoint. This is a middleware registered
+# before CORSMiddleware, so CORS wraps it and the 500 still carries the
+# Access-Control-Allow-* headers; a handler for Exception would run in
+# ServerErrorMiddleware, outside CORS, and the browser couldn't read it
+@app.middleware("http")
+async def unhandled_exception_middleware(request: Request, call_next):
+    try:
+        return await call_next(request)
+    except Exception:
+        error_id = str(uuid.uuid4())
+        logger.exception(f"Unhandled error {error_id} on {request.method} {request.url.path}")
+        return JSONResponse(
+            status_code=500,
+            content={"detail": "Internal server error", "error_id": error_id}
+        )
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -2152,6 +2242,7 @@ logger = logging.getLogger(__name__)
 @app.on_event("startup")
 async def startup_event():
     await init_database()
+    await migrate_task_dates()
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
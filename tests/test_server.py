@@ -0,0 +1,300 @@
+"""In-process tests for backend/server.py behaviour that the live API suites
+can't reach: seeded history and forced failures.
+
+The app runs under FastAPI's TestClient against a small in-memory stand-in
+for the handful of Motor collection calls these paths make.
+"""
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+# server.py reads these at import time; no connection is opened until a query
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "planner_test")
+os.environ.setdefault("CORS_ORIGINS", "http://localhost:3000")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+
+ORIGIN = "http://localhost:3000"
+
+
+def _matches(doc, query):
+    for key, cond in query.items():
+        value = doc.get(key)
+        if isinstance(cond, dict) and cond and all(op.startswith("$") for op in cond):
+            for op, arg in cond.items():
+                if op == "$gte" and not (value is not None and value >= arg):
+                    return False
+                if op == "$lt" and not (value is not None and value < arg):
+                    return False
+                if op == "$in" and value not in arg:
+                    return False
+        elif value != cond:
+            return False
+    return True
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self._docs = docs
+
+    async def to_list(self, length):
+        return [dict(doc) for doc in self._docs[:length]]
+
+
+class FakeCollection:
+    """The subset of AsyncIOMotorCollection the tested endpoints use"""
+
+    def __init__(self, docs=()):
+        self.docs = [dict(doc) for doc in docs]
+
+    def find(self, query=None, projection=None):
+        return FakeCursor([doc for doc in self.docs if _matches(doc, query or {})])
+
+    async def find_one(self, query, projection=None):
+        for doc in self.docs:
+            if _matches(doc, query):
+                return dict(doc)
+        return None
+
+    async def find_one_and_delete(self, query, projection=None):
+        for i, doc in enumerate(self.docs):
+            if _matches(doc, query):
+                return self.docs.pop(i)
+        return None
+
+    async def insert_one(self, doc):
+        self.docs.append(dict(doc))
+
+    async def insert_many(self, docs):
+        self.docs.extend(dict(doc) for doc in docs)
+
+    async def update_one(self, query, update, upsert=False):
+        for doc in self.docs:
+            if _matches(doc, query):
+                self._apply(doc, update)
+                return SimpleNamespace(modified_count=1)
+        if upsert:
+            doc = {key: value for key, value in query.items() if not isinstance(value, dict)}
+            self._apply(doc, update)
+            self.docs.append(doc)
+        return SimpleNamespace(modified_count=0)
+
+    async def update_many(self, query, update):
+        matched = [doc for doc in self.docs if _matches(doc, query)]
+        for doc in matched:
+            self._apply(doc, update)
+        return SimpleNamespace(modified_count=len(matched))
+
+    async def delete_one(self, query):
+        for i, doc in enumerate(self.docs):
+            if _matches(doc, query):
+                del self.docs[i]
+                return SimpleNamespace(deleted_count=1)
+        return SimpleNamespace(deleted_count=0)
+
+    async def delete_many(self, query):
+        kept = [doc for doc in self.docs if not _matches(doc, query)]
+        deleted = len(self.docs) - len(kept)
+        self.docs[:] = kept
+        return SimpleNamespace(deleted_count=deleted)
+
+    async def distinct(self, key, query=None):
+        return list({doc.get(key) for doc in self.docs if _matches(doc, query or {})})
+
+    @staticmethod
+    def _apply(doc, update):
+        doc.update(update.get("$set", {}))
+        for key in update.get("$unset", {}):
+            doc.pop(key, None)
+        for key, step in update.get("$inc", {}).items():
+            doc[key] = doc.get(key, 0) + step
+
+
+ADMIN = SimpleNamespace(id="admin-1", name="Admin", email="admin@example.com", role=server.UserRole.ADMIN)
+CLIENT = SimpleNamespace(id="client-1", name="Client One", email="client@example.com", role=server.UserRole.CLIENT)
+
+
+@pytest.fixture
+def db(monkeypatch):
+    fake = SimpleNamespace(
+        tasks=FakeCollection(),
+        users=FakeCollection(),
+        admin_analytics=FakeCollection(),
+        chat_messages=FakeCollection(),
+    )
+    monkeypatch.setattr(server, "db", fake)
+    server.invalidate_admin_analytics_cache()
+    return fake
+
+
+def _login_as(monkeypatch, user):
+    async def current_user(request):
+        return user
+    monkeypatch.setattr(server, "require_auth", current_user)
+    if user.role == server.UserRole.ADMIN:
+        monkeypatch.setattr(server, "require_admin", current_user)
+
+
+@pytest.fixture
+def api():
+    # Unexpected errors should come back as responses, not be re-raised here
+    return TestClient(server.app, raise_server_exceptions=False)
+
+
+def _previous_month_task():
+    first_of_month = datetime.now(timezone.utc).replace(day=1, hour=12, minute=0, second=0, microsecond=0)
+    created_at = (first_of_month - timedelta(days=1)).replace(day=2)
+    return {
+        "id": "task-past",
+        "title": "Closed Month Task",
+        "due_datetime": (created_at + timedelta(days=30)).isoformat(),
+        "project_price": 1000.0,
+        "status": "pending",
+        "priority": "medium",
+        "created_by": CLIENT.id,
+        "created_at": created_at,
+        "updated_at": created_at.isoformat(),
+    }
+
+
+def _month(analytics, month_year):
+    return next(entry for entry in analytics if entry["month_year"] == month_year)
+
+
+def _stored_month(db, month_year):
+    return next(doc for doc in db.admin_analytics.docs if doc["month_year"] == month_year)
+
+
+def test_editing_a_closed_month_task_refreshes_admin_analytics(db, api, monkeypatch):
+    _login_as(monkeypatch, ADMIN)
+    task = _previous_month_task()
+    db.tasks.docs.append(task)
+    month_year = task["created_at"].strftime("%Y-%m")
+
+    response = api.get("/api/analytics/admin", params={"months": 2})
+    assert response.status_code == 200
+    assert _month(response.json(), month_year)["total_revenue"] == 1000.0
+    assert _stored_month(db, month_year).get("completed_at") is not None
+
+    response = api.put(f"/api/tasks/{task['id']}", json={"project_price": 2500.0})
+    assert response.status_code == 200
+    response = api.get("/api/analytics/admin", params={"months": 2})
+    assert _month(response.json(), month_year)["total_revenue"] == 2500.0
+
+    response = api.put(f"/api/tasks/{task['id']}/status", params={"status": "completed"})
+    assert response.status_code == 200
+    response = api.get("/api/analytics/admin", params={"months": 2})
+    assert _month(response.json(), month_year)["completed_projects"] == 1
+
+    response = api.delete(f"/api/tasks/{task['id']}")
+    assert response.status_code == 200
+    response = api.get("/api/analytics/admin", params={"months": 2})
+    assert _month(response.json(), month_year)["total_projects"] == 0
+
+
+def test_deleting_a_client_reopens_their_signup_month(db, api, monkeypatch):
+    _login_as(monkeypatch, ADMIN)
+    signed_up = _previous_month_task()["created_at"]
+    month_year = signed_up.strftime("%Y-%m")
+    db.users.docs.append({
+        "id": CLIENT.id, "name": CLIENT.name, "email": CLIENT.email,
+        "role": "client", "created_at": signed_up.isoformat(),
+    })
+
+    response = api.get("/api/analytics/admin", params={"months": 2})
+    assert _month(response.json(), month_year)["new_clients"] == 1
+    assert _stored_month(db, month_year).get("completed_at") is not None
+
+    response = api.delete(f"/api/admin/users/{CLIENT.id}")
+    assert response.status_code == 200
+    response = api.get("/api/analytics/admin", params={"months": 2})
+    assert _month(response.json(), month_year)["new_clients"] == 0
+
+
+def test_reopen_during_calculation_keeps_the_month_open(db, monkeypatch):
+    task = _previous_month_task()
+    db.tasks.docs.append(task)
+    month_year = task["created_at"].strftime("%Y-%m")
+    read_tasks = db.tasks.find
+
+    def find_then_reopen(query=None, projection=None):
+        # A task write lands after the calculation has read the old figures
+        cursor = read_tasks(query, projection)
+        stale = cursor.to_list
+
+        async def to_list(length):
+            docs = await stale(length)
+            await server.reopen_admin_analytics_months([task["created_at"]])
+            return docs
+        cursor.to_list = to_list
+        return cursor
+    monkeypatch.setattr(db.tasks, "find", find_then_reopen)
+
+    asyncio.run(server.calculate_admin_analytics(month_year))
+
+    assert "completed_at" not in _stored_month(db, month_year)
+
+
+def test_unexpected_chat_error_returns_500_with_cors_headers(db, api, monkeypatch):
+    _login_as(monkeypatch, CLIENT)
+
+    async def broken_lookup(*args, **kwargs):
+        raise RuntimeError("database unavailable")
+    monkeypatch.setattr(db.users, "find_one", broken_lookup)
+
+    response = api.post(
+        "/api/chat/messages",
+        json={"content": "Hello", "recipient_id": ADMIN.id},
+        headers={"Origin": ORIGIN},
+    )
+
+    assert response.status_code == 500
+    assert response.headers["access-control-allow-origin"] == ORIGIN
+    assert response.headers["access-control-allow-credentials"] == "true"
+    body = response.json()
+    assert body["detail"] == "Internal server error"
+    assert body["error_id"]
+
+
+def _bulk_payload(count):
+    due = (datetime.now(timezone.utc) + timedelta(days=30)).isoformat()
+    return [{"title": f"Bulk Task {i}", "due_datetime": due, "project_price": 100.0} for i in range(count)]
+
+
+def test_bulk_create_tasks(db, api, monkeypatch):
+    _login_as(monkeypatch, CLIENT)
+
+    response = api.post("/api/tasks/bulk", json=_bulk_payload(3))
+
+    assert response.status_code == 200
+    assert [task["title"] for task in response.json()] == ["Bulk Task 0", "Bulk Task 1", "Bulk Task 2"]
+    assert {task["created_by"] for task in db.tasks.docs} == {CLIENT.id}
+    assert len(db.tasks.docs) == 3
+
+
+def test_bulk_create_tasks_empty_list(db, api, monkeypatch):
+    _login_as(monkeypatch, CLIENT)
+
+    response = api.post("/api/tasks/bulk", json=[])
+
+    assert response.status_code == 200
+    assert response.json() == []
+    assert db.tasks.docs == []
+
+
+def test_bulk_create_tasks_over_limit(db, api, monkeypatch):
+    _login_as(monkeypatch, CLIENT)
+
+    response = api.post("/api/tasks/bulk", json=_bulk_payload(server.MAX_BULK_TASKS + 1))
+
+    assert response.status_code == 400
+    assert str(server.MAX_BULK_TASKS) in response.json()["detail"]
+    assert db.tasks.docs == []